@@ -8,6 +8,7 @@ const os = require('os');
 const multer = require('multer');
 const { v4: uuidv4 } = require('uuid');
 const { safeLog } = require('./src/security/safeLog');
+const { spooledStorage } = require('./src/upload/spooledStorage');
 
 const { processDocument } = require('./src/process/processDocument');
 
@@ -17,11 +18,16 @@ app.disable('x-powered-by');
 const PORT = process.env.PORT || 3000;
 const MAX_UPLOAD_MB = Number(process.env.MAX_UPLOAD_MB || '10');
 const MAX_UPLOAD_BYTES = MAX_UPLOAD_MB * 1024 * 1024;
+const SPOOL_MAX_BYTES = 2 * 1024 * 1024;
+// Total bytes of uploads kept in memory across all jobs; beyond this they go to the job dir
+const MEMORY_UPLOADS_MAX_BYTES = 32 * 1024 * 1024;
 
 const TMP_ROOT = path.join(os.tmpdir(), 'via-tool');
 const JOB_TTL_MS = 30 * 60 * 1000;
+const PROCESS_MAX_SECONDS = 360;
 
-const jobs = new Map(); // jobId -> { dir, inputPath, outputPath, createdAt, status }
+const jobs = new Map(); // jobId -> { dir, inputPath, inputBuffer, inputHash, outputPath, createdAt, status }
+let memoryUploadBytes = 0; // sum of inputBuffer lengths held by jobs
 
 app.use((req, res, next) => {
   res.setHeader('Referrer-Policy', 'no-referrer');
@@ -75,16 +81,18 @@ app.use((req, res, next) => {
   next();
 });
 
-app.use(express.json({ limit: '256kb' }));
+// JSON bodies only exist on /api/process; other routes skip the parser entirely
+const jsonBody = express.json({ limit: '256kb' });
 app.use(express.static(path.join(__dirname, 'public'), { extensions: ['html'] }));
 
 async function ensureTmpRoot() {
   await fsp.mkdir(TMP_ROOT, { recursive: true });
 }
 
-function isAllowedExt(filename) {
-  const ext = path.extname(filename || '').toLowerCase();
-  return ['.txt', '.docx', '.pdf'].includes(ext);
+const ALLOWED_EXTS = new Set(['.txt', '.docx', '.pdf']);
+
+function uploadExt(filename) {
+  return path.extname(filename || '').toLowerCase();
 }
 
 function auditLogStream(res, { processed, errorCode }) {
@@ -100,10 +108,17 @@ function auditLogStream(res, { processed, errorCode }) {
   res.status(200).end(data);
 }
 
+function releaseInputBuffer(job) {
+  if (!job.inputBuffer) return;
+  memoryUploadBytes -= job.inputBuffer.length;
+  job.inputBuffer = null;
+}
+
 async function cleanupJob(jobId) {
   const job = jobs.get(jobId);
   if (!job) return;
   jobs.delete(jobId);
+  releaseInputBuffer(job);
   try {
     await fsp.rm(job.dir, { recursive: true, force: true });
   } catch (_) {}
@@ -116,11 +131,42 @@ setInterval(() => {
   }
 }, 60 * 1000).unref();
 
+function inputName(file) {
+  return 'input' + file.ext;
+}
+
+// Small uploads stay in memory; larger ones stream straight into the job dir
 const upload = multer({
-  storage: multer.memoryStorage(),
+  storage: spooledStorage({
+    spillBytes: SPOOL_MAX_BYTES,
+    destination: (req) => fsp.mkdir(req.jobDir, { recursive: true }).then(() => req.jobDir),
+    filename: (req, file) => inputName(file)
+  }),
+  fileFilter: (req, file, cb) => {
+    // Case-fold the extension once; storage and the job entry reuse it
+    file.ext = uploadExt(file.originalname);
+    if (!ALLOWED_EXTS.has(file.ext)) {
+      req.fileRejected = true;
+      return cb(null, false);
+    }
+    cb(null, true);
+  },
   limits: { fileSize: MAX_UPLOAD_BYTES }
 });
 
+function assignJob(req, res, next) {
+  req.jobId = uuidv4();
+  req.jobDir = path.join(TMP_ROOT, req.jobId);
+  next();
+}
+
+function receiveUpload(req, res, next) {
+  upload.single('file')(req, res, (err) => {
+    if (err) fsp.rm(req.jobDir, { recursive: true, force: true }).catch(() => {});
+    next(err);
+  });
+}
+
 function requireApiKey(req, res, next) {
   const apiKey = (req.header('X-API-Key') || '').trim();
   if (!apiKey) {
@@ -135,38 +181,46 @@ function requireApiKey(req, res, next) {
   next();
 }
 
-app.post('/api/upload', requireApiKey, upload.single('file'), async (req, res) => {
+app.post('/api/upload', requireApiKey, assignJob, receiveUpload, async (req, res) => {
   try {
-    await ensureTmpRoot();
-
-    if (!req.file || !req.file.originalname) {
+    if (req.fileRejected) {
       return res.status(400).json({
         status: 'error',
-        signals: [{ code: 'E002', message: 'Bestand ontbreekt of kan niet worden gelezen. Upload opnieuw.' }],
+        signals: [{ code: 'E002', message: 'Bestandstype niet ondersteund. Upload een .txt, .docx of .pdf.' }],
         techHelp: false,
         auditLogUrl: null
       });
     }
 
-    if (!isAllowedExt(req.file.originalname)) {
+    if (!req.file || !req.file.originalname) {
       return res.status(400).json({
         status: 'error',
-        signals: [{ code: 'E002', message: 'Bestandstype niet ondersteund. Upload een .txt, .docx of .pdf.' }],
+        signals: [{ code: 'E002', message: 'Bestand ontbreekt of kan niet worden gelezen. Upload opnieuw.' }],
         techHelp: false,
         auditLogUrl: null
       });
     }
 
-    const jobId = uuidv4();
-    const dir = path.join(TMP_ROOT, jobId);
+    const jobId = req.jobId;
+    const dir = req.jobDir;
     await fsp.mkdir(dir, { recursive: true });
 
-    const inputPath = path.join(dir, 'input' + path.extname(req.file.originalname).toLowerCase());
-    await fsp.writeFile(inputPath, req.file.buffer);
+    const inputPath = req.file.path || path.join(dir, inputName(req.file));
+    let inputBuffer = req.file.buffer || null;
+    if (inputBuffer) {
+      if (memoryUploadBytes + inputBuffer.length > MEMORY_UPLOADS_MAX_BYTES) {
+        await fsp.writeFile(inputPath, inputBuffer);
+        inputBuffer = null;
+      } else {
+        memoryUploadBytes += inputBuffer.length;
+      }
+    }
 
     jobs.set(jobId, {
       dir,
       inputPath,
+      inputBuffer,
+      inputHash: req.file.hash,
       outputPath: path.join(dir, 'output.txt'),
       createdAt: Date.now(),
       status: 'uploaded'
@@ -175,6 +229,7 @@ app.post('/api/upload', requireApiKey, upload.single('file'), async (req, res) =
     safeLog('job_status:uploaded');
     return res.status(200).json({ status: 'ok', jobId });
   } catch (_) {
+    await fsp.rm(req.jobDir, { recursive: true, force: true }).catch(() => {});
     safeLog('error_code:W010');
     return res.status(500).json({
       status: 'error',
@@ -185,7 +240,7 @@ app.post('/api/upload', requireApiKey, upload.single('file'), async (req, res) =
   }
 });
 
-app.post('/api/process', requireApiKey, async (req, res) => {
+app.post('/api/process', requireApiKey, jsonBody, async (req, res) => {
   const jobId = (req.body && req.body.jobId) || '';
   const job = jobs.get(jobId);
 
@@ -204,9 +259,11 @@ app.post('/api/process', requireApiKey, async (req, res) => {
 
     const result = await processDocument({
       inputPath: job.inputPath,
+      inputBuffer: job.inputBuffer,
+      inputHash: job.inputHash,
       outputPath: job.outputPath,
       apiKey: req.apiKey,
-      maxSeconds: 360
+      maxSeconds: PROCESS_MAX_SECONDS
     });
 
     if (!result || result.ok !== true) {
@@ -289,7 +346,14 @@ app.get('/api/error-log', async (req, res) => {
 
 app.get('/healthz', (req, res) => res.status(200).send('ok'));
 
-app.listen(PORT, async () => {
+const server = app.listen(PORT, async () => {
   await ensureTmpRoot();
   safeLog(`server_started:${PORT}`);
 });
+
+// Requests are handled on the event loop, so waiting on OpenAI never blocks other uploads.
+// Node's default requestTimeout (5 min) would cut off /api/process before its own limit.
+server.requestTimeout = (PROCESS_MAX_SECONDS + 30) * 1000;
+// Keep idle connections open longer than the platform proxy does, so they get reused
+server.keepAliveTimeout = 65 * 1000;
+server.headersTimeout = 66 * 1000;
@@ -0,0 +1,32 @@
+'use strict';
+// Bounded in-memory cache with expiry; Map order doubles as LRU order.
+// weigh(data) sizes an entry; oldest entries are dropped until the total is within maxWeight.
+function createCache({maxEntries,ttlMs,maxWeight=Infinity,weigh=()=>0}){
+  const cache=new Map(); // key -> { data, weight, expiresAt }
+  let total=0;
+  function drop(key){
+    const hit=cache.get(key);
+    if(!hit) return;
+    cache.delete(key);
+    total-=hit.weight;
+  }
+  function get(key){
+    const hit=cache.get(key);
+    if(!hit) return null;
+    drop(key);
+    if(Date.now()>hit.expiresAt) return null;
+    cache.set(key,hit);
+    total+=hit.weight;
+    return hit.data;
+  }
+  function set(key,data){
+    drop(key);
+    const weight=weigh(data);
+    if(weight>maxWeight) return;
+    cache.set(key,{data,weight,expiresAt:Date.now()+ttlMs});
+    total+=weight;
+    while(cache.size>maxEntries||total>maxWeight) drop(cache.keys().next().value);
+  }
+  return {get,set};
+}
+module.exports={createCache};
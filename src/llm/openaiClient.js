@@ -1,6 +1,7 @@
 'use strict';
 const OpenAI=require('openai');
 const {LLM_SCHEMA}=require('./schema');
+const {cacheKey,getCached,setCached}=require('./responseCache');
 
 function extractJsonText(resp){
   if(!resp) return null;
@@ -14,29 +15,36 @@ function extractJsonText(resp){
   }
   return null;
 }
+// Responses API takes name/schema/strict directly on format (no nested json_schema as in Chat Completions)
+const TEXT_FORMAT={format:{type:'json_schema',name:LLM_SCHEMA.name,schema:LLM_SCHEMA.schema,strict:true}};
 function safeParse(txt){try{return {ok:true,data:JSON.parse(txt)};}catch(_){return {ok:false};}}
-async function callLLM({apiKey,instructions,input,model}){
-  const client=new OpenAI({apiKey});
+async function callLLM({client,instructions,input,model}){
   const resp=await client.responses.create({
     model: model || 'gpt-4o-mini',
     instructions,
     input,
     store:false,
-    text:{format:{type:'json_schema',json_schema:{name:LLM_SCHEMA.name,schema:LLM_SCHEMA.schema,strict:true}}}
+    text:TEXT_FORMAT
   });
   return extractJsonText(resp);
 }
 async function generateStructured({apiKey,instructions,input,model,retryOnce}){
+  const key=cacheKey([model,apiKey,instructions,input]);
+  const cached=getCached(key);
+  if(cached) return {ok:true,data:cached};
   try{
-    const txt=await callLLM({apiKey,instructions,input,model});
+    // One client per call, shared with the retry; the SDK's own keep-alive agent pools connections across clients.
+    // Clients are not kept beyond the request, so neither is the API key.
+    const client=new OpenAI({apiKey});
+    const txt=await callLLM({client,instructions,input,model});
     const p=safeParse(txt||'');
-    if(p.ok) return {ok:true,data:p.data};
+    if(p.ok){setCached(key,p.data); return {ok:true,data:p.data};}
 
     if(retryOnce){
       const strictInstr=instructions+'\n\nBELANGRIJK: Je geeft alleen 1 JSON-object terug. Geen extra tekens ervoor of erna.';
-      const txt2=await callLLM({apiKey,instructions:strictInstr,input,model});
+      const txt2=await callLLM({client,instructions:strictInstr,input,model});
       const p2=safeParse(txt2||'');
-      if(p2.ok) return {ok:true,data:p2.data};
+      if(p2.ok){setCached(key,p2.data); return {ok:true,data:p2.data};}
     }
 
     return {ok:false, ...classifyOpenAIError({})};
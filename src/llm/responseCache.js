@@ -0,0 +1,14 @@
+'use strict';
+const crypto=require('crypto');
+const {createCache}=require('../cache/lru');
+const MAX_ENTRIES=32;
+const TTL_MS=30*60*1000;
+
+// Key is a digest only: neither the API key nor the source text is kept in memory as-is.
+function cacheKey(parts){
+  const h=crypto.createHash('sha256');
+  for(const p of parts){h.update(String(p||'')); h.update('\0');}
+  return h.digest('hex');
+}
+const responses=createCache({maxEntries:MAX_ENTRIES,ttlMs:TTL_MS});
+module.exports={cacheKey,getCached:responses.get,setCached:responses.set};
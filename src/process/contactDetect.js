@@ -1,25 +1,42 @@
 'use strict';
-const EMAIL_RE=/\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b/gi;
-const URL_RE=/(https?:\/\/\S+|www\.\S+)/gi;
-const PHONE_RE=/(\+31\s?6\s?\d{8}|06\s?\d{8}|0\d{1,3}[\s-]?\d{6,8})/g;
-function detectContactBlock(sourceRaw){
-  const raw=String(sourceRaw||'');
-  const lines=raw.split(/\r\n|\n|\r/).map(l=>l.trim()).filter(Boolean);
-  const startIdx=lines.findIndex(l=>/^(contact|voor vragen|noot voor de redactie|perscontact|media|niet voor publicatie)/i.test(l));
+const {splitLines}=require('./normalize');
+// email / phone / url in one scan; no g-flag so .test() carries no lastIndex between lines
+const CONTACT_RE=/\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b|\+31\s?6\s?\d{8}|06\s?\d{8}|0\d{1,3}[\s-]?\d{6,8}|https?:\/\/\S+|www\.\S+/i;
+const WS_RE=/\s+/g;
+const HEADER_RE=/^(contact|voor vragen|noot voor de redactie|perscontact|media|niet voor publicatie)/i;
+// Header or contact detail in one scan per line, for as long as both are still unknown
+const HEADER_OR_CONTACT_RE=new RegExp(`(?<header>${HEADER_RE.source})|${CONTACT_RE.source}`,'i');
+const HINT_RE=/(contact|vragen|pers|media|niet voor publicatie)/i;
+// Keep test in one scan; when it hits on a contact detail, that match also answers "found"
+const KEEP_RE=new RegExp(`(?<hint>${HINT_RE.source})|${CONTACT_RE.source}`,'i');
+function detectContactBlock(sourceRaw,rawLines){
+  // One pass over the lines: stop as soon as a header and its 25-line window are collected
+  const lines=[]; let startIdx=-1; let idx=-1;
+  for(const rawLine of (rawLines||splitLines(sourceRaw))){
+    const l=rawLine.trim();
+    if(!l) continue;
+    lines.push(l);
+    if(startIdx<0){
+      if(idx<0){
+        const m=HEADER_OR_CONTACT_RE.exec(l);
+        if(m&&m.groups.header) startIdx=lines.length-1;
+        else if(m) idx=lines.length-1;
+      }else if(HEADER_RE.test(l)) startIdx=lines.length-1;
+    }else if(lines.length>=startIdx+25) break;
+  }
   let cand=[];
   if(startIdx>=0) cand=lines.slice(startIdx,startIdx+25);
-  else{
-    const idx=lines.findIndex(l=>EMAIL_RE.test(l)||PHONE_RE.test(l)||URL_RE.test(l));
-    if(idx>=0) cand=lines.slice(Math.max(0,idx-2),Math.min(lines.length,idx+10));
+  else if(idx>=0) cand=lines.slice(Math.max(0,idx-2),Math.min(lines.length,idx+10));
+  // Candidates are trimmed and non-empty, so collapsing inner whitespace cannot empty them; stop at 10 kept lines
+  const cleaned=[]; let found=false;
+  for(const l of cand){
+    if(cleaned.length>=10) break;
+    const m=KEEP_RE.exec(l);
+    if(!m) continue;
+    const c=l.replace(WS_RE,' ');
+    cleaned.push(c);
+    if(!found) found=(!m.groups.hint&&c===l)||CONTACT_RE.test(c);
   }
-  EMAIL_RE.lastIndex=0;
-  const keep=cand.filter(l=>
-    /(contact|vragen|pers|media|niet voor publicatie)/i.test(l) ||
-    EMAIL_RE.test(l)||PHONE_RE.test(l)||URL_RE.test(l)
-  );
-  const cleaned=keep.map(l=>l.replace(/\s+/g,' ').trim()).filter(Boolean).slice(0,10);
-  const found=cleaned.some(l=>EMAIL_RE.test(l)||PHONE_RE.test(l)||URL_RE.test(l));
-  EMAIL_RE.lastIndex=0;
   return {found,lines:cleaned};
 }
 module.exports={detectContactBlock};
@@ -0,0 +1,4 @@
+'use strict';
+// Dutch month names as one non-capturing alternation, shared by the date patterns.
+const MONTHS_ALT='(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)';
+module.exports={MONTHS_ALT};
@@ -1,7 +1,23 @@
 'use strict';
+const WS_RE=/\s+/g;
+const LINE_RE=/\r\n|\n|\r/;
 function normalizeText(raw){
-  const oneLine=String(raw||'').replace(/\r\n|\n|\r/g,' ');
-  const single=oneLine.replace(/\s+/g,' ').trim();
+  // \s already covers \r and \n, so one pass collapses line breaks and spaces alike
+  const single=String(raw||'').replace(WS_RE,' ').trim();
   return {text:single,charCount:single.length};
 }
-module.exports={normalizeText};
+// Same code points as the \s class
+function isSpace(c){
+  return c===32||(c>=9&&c<=13)||c===160||c===5760||(c>=8192&&c<=8202)||c===8232||c===8233||c===8239||c===8287||c===12288||c===65279;
+}
+// Length of normalizeText(raw).text, counted in one scan without building the normalized string
+function collapsedLength(raw){
+  const s=String(raw||''); let len=0; let gap=false;
+  for(let i=0;i<s.length;i++){
+    if(isSpace(s.charCodeAt(i))){if(len>0) gap=true;}
+    else{if(gap){len++; gap=false;} len++;}
+  }
+  return len;
+}
+function splitLines(raw){return String(raw||'').split(LINE_RE);}
+module.exports={normalizeText,collapsedLength,splitLines};
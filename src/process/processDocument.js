@@ -1,30 +1,68 @@
 'use strict';
-const fs=require('fs/promises');
+const fs=require('fs/promises'); const path=require('path');
 const {safeLog}=require('../security/safeLog');
 const {extractText}=require('./extractText');
+const {splitLines}=require('./normalize');
 const {detectSecondPressRelease}=require('./secondPressReleaseDetector');
 const {detectContactBlock}=require('./contactDetect');
-const {runValidators}=require('./runValidators');
+const {runValidators,preflightValidators}=require('./runValidators');
 const {buildOutput}=require('./outputBuilder');
 const {buildInstructions,buildInput}=require('../llm/promptBuilder');
 const {generateStructured}=require('../llm/openaiClient');
+const {createCache}=require('../cache/lru');
 
-async function processDocument({inputPath,outputPath,apiKey,maxSeconds}){
+// Analyses by upload content, so processing the same file again skips extraction and detection.
+// Bounded by entry count and by total text length; only sources that pass the E004/E007 gates are kept.
+const ANALYSIS_CACHE_MAX_CHARS=8*1024*1024;
+const analysisCache=createCache({maxEntries:32,ttlMs:30*60*1000,maxWeight:ANALYSIS_CACHE_MAX_CHARS,weigh:(a)=>a.text.length});
+
+async function analyzeSource({inputPath,inputBuffer}){
+  const ex=await extractText(inputPath,inputBuffer);
+  if(!ex.ok) return {ex};
+  const rawLines=splitLines(ex.rawText);
+  return {
+    ex,
+    analysis:{
+      text:ex.text,
+      charCount:ex.charCount,
+      detector:detectSecondPressRelease(ex.rawText,rawLines),
+      // Only used on success, which a source under 950 chars never reaches (E004)
+      contact:ex.charCount<950?null:detectContactBlock(ex.rawText,rawLines)
+    }
+  };
+}
+
+// inputHash: content digest of the upload; processing the same content again (same job or another) reuses its analysis.
+async function processDocument({inputPath,inputBuffer,inputHash,outputPath,apiKey,maxSeconds}){
   const start=Date.now();
   const max=Number(maxSeconds||360);
 
   const timeLeftOk=()=>((Date.now()-start)/1000)<max;
 
   try{
-    const ex=await extractText(inputPath);
-    if(!ex.ok) return {ok:false,errorCode:ex.errorCode||'E002',techHelp:ex.techHelp===true,signals:ex.signals||[]};
+    const key=inputHash?`${inputHash}${path.extname(inputPath||'').toLowerCase()}`:null;
+    let analysis=key&&analysisCache.get(key);
+    const fresh=!analysis;
+    if(fresh){
+      const src=await analyzeSource({inputPath,inputBuffer});
+      if(!src.analysis){
+        const ex=src.ex;
+        return {ok:false,errorCode:ex.errorCode||'E002',techHelp:ex.techHelp===true,signals:ex.signals||[]};
+      }
+      analysis=src.analysis;
+    }
     if(!timeLeftOk()) return {ok:false,errorCode:'E005',techHelp:true,signals:[{code:'E005',message:'Maximale verwerkingstijd overschreden. Herstart de tool (Ctrl+F5) en probeer het opnieuw.'}]};
+    const {detector,contact}=analysis;
 
-    const detector=detectSecondPressRelease(ex.rawText);
-    const contact=detectContactBlock(ex.rawText);
+    const pre=preflightValidators({sourceCharCount:analysis.charCount,detectorResult:detector});
+    if(pre.errors.length>0){
+      safeLog(`error_code:${pre.errors[0].code}`);
+      return {ok:false,errorCode:pre.errors[0].code,techHelp:false,signals:pre.errors};
+    }
+    if(fresh&&key) analysisCache.set(key,analysis);
 
     const instructions=buildInstructions({stylebookText:''});
-    const input=buildInput({sourceText:ex.text});
+    const input=buildInput({sourceText:analysis.text});
 
     const llm=await generateStructured({
       apiKey,
@@ -47,7 +85,7 @@ async function processDocument({inputPath,outputPath,apiKey,maxSeconds}){
 
     if(!timeLeftOk()) return {ok:false,errorCode:'E005',techHelp:true,signals:[{code:'E005',message:'Maximale verwerkingstijd overschreden. Herstart de tool (Ctrl+F5) en probeer het opnieuw.'}]};
 
-    const {errors,warnings}=runValidators({sourceCharCount:ex.charCount,llmData:llm.data,detectorResult:detector,contactInfo:contact});
+    const {errors,warnings}=runValidators({sourceCharCount:analysis.charCount,llmData:llm.data,detectorResult:detector,contactInfo:contact});
     if(errors.length>0){
       safeLog(`error_code:${errors[0].code}`);
       return {ok:false,errorCode:errors[0].code,techHelp:errors[0].code==='E005'||errors[0].code==='W010',signals:errors};
@@ -5,27 +5,44 @@ const {nameInconsistencyWarnings}=require('../validators/w003_nameInconsistency'
 const {externalVerifyWarnings}=require('../validators/w008_externalVerification');
 const {lengthWarnings}=require('../validators/w007_lengthOutOfRange');
 const {titleLengthWarnings}=require('../validators/w005_w006_titleLen');
-const {missingWWarnings,minFiveWError}=require('../validators/wFields');
+const {wFieldPresence,missingWWarnings,minFiveWError}=require('../validators/wFields');
 const {contactWarnings}=require('../validators/w009_contactFound');
 
-function runValidators({sourceCharCount,llmData,detectorResult,contactInfo}){
+// Fixed signals are shared frozen objects instead of fresh literals per request
+const E007=Object.freeze({code:'E007',message:M.E007});
+const E004=Object.freeze({code:'E004',message:M.E004});
+const W015=Object.freeze({code:'W015',message:'Mogelijk meerdere persberichten in de upload. Controleer de bron.'});
+const W001=Object.freeze({code:'W001',message:'Waarom ontbreekt. Controleer of dit in de bron staat.'});
+const W002=Object.freeze({code:'W002',message:'Hoe ontbreekt. Controleer of dit in de bron staat.'});
+
+// Source-only gates: they do not depend on the LLM output, so processDocument runs them before the call.
+function preflightValidators({sourceCharCount,detectorResult}){
   const errors=[]; const warnings=[];
-  if(detectorResult?.decision==='error'){errors.push({code:'E007',message:M.E007}); return {errors,warnings};}
-  if(detectorResult?.decision==='warn'){warnings.push({code:'W015',message:'Mogelijk meerdere persberichten in de upload. Controleer de bron.'});}
-  if(typeof sourceCharCount==='number'&&sourceCharCount<950){errors.push({code:'E004',message:M.E004}); return {errors,warnings};}
+  if(detectorResult?.decision==='error'){errors.push(E007); return {errors,warnings};}
+  if(detectorResult?.decision==='warn'){warnings.push(W015);}
+  if(typeof sourceCharCount==='number'&&sourceCharCount<950){errors.push(E004); return {errors,warnings};}
+  return {errors,warnings};
+}
+
+function runValidators({sourceCharCount,llmData,detectorResult,contactInfo}){
+  const {errors,warnings}=preflightValidators({sourceCharCount,detectorResult});
+  if(errors.length>0) return {errors,warnings};
 
-  const mw=missingWWarnings(llmData); warnings.push(...mw.warnings);
-  const min=minFiveWError(llmData); if(min.error){errors.push(min.error); return {errors,warnings};}
+  const present=wFieldPresence(llmData);
+  const mw=missingWWarnings(present); warnings.push(...mw.warnings);
+  const min=minFiveWError(present); if(min.error){errors.push(min.error); return {errors,warnings};}
 
-  if(!String(llmData?.w_fields?.waarom||'').trim()) warnings.push({code:'W001',message:'Waarom ontbreekt. Controleer of dit in de bron staat.'});
-  if(!String(llmData?.w_fields?.hoe||'').trim()) warnings.push({code:'W002',message:'Hoe ontbreekt. Controleer of dit in de bron staat.'});
+  if(!present.waarom) warnings.push(W001);
+  if(!present.hoe) warnings.push(W002);
 
   warnings.push(...titleLengthWarnings(llmData?.title||''));
   warnings.push(...lengthWarnings({intro:llmData?.intro||'',body:llmData?.body||''}));
-  warnings.push(...strongClaimWarnings([llmData?.title,llmData?.intro,llmData?.body].filter(Boolean).join(' ')));
+  // Lowercased once here; the text checks below match case-sensitively on it
+  const combinedLower=[llmData?.title,llmData?.intro,llmData?.body].filter(Boolean).join(' ').toLowerCase();
+  warnings.push(...strongClaimWarnings(combinedLower));
   warnings.push(...nameInconsistencyWarnings(llmData));
-  warnings.push(...externalVerifyWarnings(llmData));
+  warnings.push(...externalVerifyWarnings(llmData,combinedLower));
   if(contactInfo?.found) warnings.push(...contactWarnings());
   return {errors,warnings};
 }
-module.exports={runValidators};
+module.exports={runValidators,preflightValidators};
@@ -1,31 +1,56 @@
 'use strict';
+const {collapsedLength,splitLines}=require('./normalize');
+const {MONTHS_ALT}=require('./dateWords');
+const DATELINE_RE=new RegExp(String.raw`\b[A-ZÁÉÍÓÚÄËÏÖÜ][\w\-.' ]{2,30},\s?\d{1,2}(?:[\-\/. ]\d{1,2}(?:[\-\/. ]\d{2,4})?|\s+${MONTHS_ALT}\s+\d{4})\b`,'i');
+const SEPARATOR_RE=/^(?:\*\*\*+|—+|-{3,}|=+|einde persbericht)$/i;
+// Every separator line contains one of these; without a hit the per-line scan can be skipped.
+const SEPARATOR_HINT_RE=/\*\*\*|—|---|=|einde persbericht/i;
+const SENTENCE_END_RE=/[.!?]$/;
+const CONTACT_HINT_RE=/(?:contact|pers|media|\bwww\.|@|\+31|\b06\b)/i;
 function looksLikeDateline(s){
-  return /\b[A-ZÁÉÍÓÚÄËÏÖÜ][\w\-.' ]{2,30},\s?\d{1,2}([\-\/. ]\d{1,2}([\-\/. ]\d{2,4})?|\s+(januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)\s+\d{4})\b/i.test(s);
+  return DATELINE_RE.test(s);
 }
-function looksLikeSeparator(s){return /^(\*\*\*+|—+|-{3,}|=+|einde persbericht)$/i.test(s.trim());}
-function splitSections(raw){
-  const lines=String(raw||'').split(/\r\n|\n|\r/);
-  for(let i=0;i<lines.length;i++){
-    if(looksLikeSeparator((lines[i]||'').trim())) return {first:lines.slice(0,i).join('\n'),second:lines.slice(i+1).join('\n')};
+function looksLikeSeparator(s){return SEPARATOR_RE.test(s.trim());}
+// Lines of the second section, taken from the already split source instead of re-joining and re-splitting it.
+// The section starts after a separator line, or else after the first blank block: three or more
+// whitespace-only lines (not counting line 0) followed by a newline. A block running to the end leaves only the last line.
+function secondSectionLines(raw,rawLines){
+  const lines=rawLines||splitLines(raw);
+  if(SEPARATOR_HINT_RE.test(String(raw||''))){
+    for(let i=0;i<lines.length;i++){
+      if(looksLikeSeparator(lines[i]||'')) return lines.slice(i+1);
+    }
   }
-  const joined=lines.join('\n');
-  const parts=joined.split(/\n\s*\n\s*\n\s*\n+/);
-  if(parts.length>=2) return {first:parts[0],second:parts.slice(1).join('\n')};
-  return {first:joined,second:''};
+  let blank=0;
+  for(let i=1;i<lines.length;i++){
+    if(!lines[i].trim()){blank++; continue;}
+    if(blank>=3) return lines.slice(i);
+    blank=0;
+  }
+  if(blank>=4) return lines.slice(-1);
+  return [];
 }
-function countChars(s){return String(s||'').replace(/\r\n|\n|\r/g,' ').replace(/\s+/g,' ').trim().length;}
-function detectSecondPressRelease(raw){
-  const {first,second}=splitSections(raw);
-  const secondLen=countChars(second);
+function detectSecondPressRelease(raw,rawLines){
+  const secondLines=secondSectionLines(raw,rawLines);
   let score=0; const triggers=[];
-  const lines=second.split(/\r\n|\n|\r/).map(l=>l.trim()).filter(Boolean);
-  if(lines.some(looksLikeDateline)){score+=2;triggers.push('dateline');}
-  const lead=lines.slice(0,5).join(' ');
-  if(lead.length>80&&lead.length<320&&/\./.test(lead)){score+=2;triggers.push('lead');}
-  const titleLine=lines.slice(0,6).find(l=>l.length>=20&&l.length<=120&&!/[.!?]$/.test(l));
+  // One pass over the non-empty lines: length, dateline and contact anywhere, lead = first 5 lines, title within the first 6
+  let n=0; let secondLen=0; let dateline=false; let leadLen=0; let leadPeriod=false; let titleLine=false; let contact=false;
+  for(const rawLine of secondLines){
+    const l=rawLine.trim();
+    if(!l) continue;
+    secondLen+=(n?1:0)+collapsedLength(l);
+    if(n<5){leadLen+=(n?1:0)+l.length; if(!leadPeriod) leadPeriod=l.includes('.');}
+    if(n<6&&!titleLine) titleLine=l.length>=20&&l.length<=120&&!SENTENCE_END_RE.test(l);
+    if(!dateline) dateline=looksLikeDateline(l);
+    if(!contact) contact=CONTACT_HINT_RE.test(l);
+    n++;
+  }
+  const hasSecond=secondLines.length>1||(secondLines.length===1&&secondLines[0]!=='');
+  if(dateline){score+=2;triggers.push('dateline');}
+  if(leadLen>80&&leadLen<320&&leadPeriod){score+=2;triggers.push('lead');}
   if(titleLine){score+=1;triggers.push('title');}
-  if(/(contact|pers|media|\bwww\.|@|\+31|\b06\b)/i.test(second)){score+=1;triggers.push('contact');}
-  if(second){score+=1;triggers.push('separator');}
+  if(contact){score+=1;triggers.push('contact');}
+  if(hasSecond){score+=1;triggers.push('separator');}
   let decision='none';
   if(score>=4&&secondLen>=900) decision='error';
   else if(score>=2) decision='warn';
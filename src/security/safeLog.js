@@ -1,7 +1,8 @@
 'use strict';
+const LINE_BREAK_RE=/[\r\n]/g;
 function safeLog(message){
   if(!message||typeof message!=='string')return;
-  const clean=message.replace(/[\r\n]/g,' ').slice(0,200);
+  const clean=message.slice(0,200).replace(LINE_BREAK_RE,' ');
   console.log(clean);
 }
 module.exports={safeLog};
@@ -0,0 +1,59 @@
+'use strict';
+const fs=require('fs');
+const path=require('path');
+const crypto=require('crypto');
+
+// Multer storage engine: uploads up to spillBytes stay in memory (file.buffer),
+// larger ones are written to destination()/filename() as they stream in (file.path).
+// file.hash is the sha256 of the content, computed on the same pass.
+function spooledStorage({spillBytes,destination,filename}){
+  function _handleFile(req,file,cb){
+    const stream=file.stream;
+    const chunks=[]; let size=0; let out=null; let outPath=null; let opening=null; let failed=false;
+    const hash=crypto.createHash('sha256');
+    const fail=(err)=>{
+      if(failed) return;
+      failed=true;
+      if(out) out.destroy();
+      stream.resume();
+      cb(err);
+    };
+    stream.on('data',(chunk)=>{
+      size+=chunk.length;
+      hash.update(chunk);
+      if(out){
+        if(!out.write(chunk)){stream.pause(); out.once('drain',()=>stream.resume());}
+        return;
+      }
+      chunks.push(chunk);
+      if(size<=spillBytes) return;
+      stream.pause();
+      opening=destination(req,file).then((dir)=>{
+        outPath=path.join(dir,filename(req,file));
+        out=fs.createWriteStream(outPath);
+        out.on('error',fail);
+        out.write(Buffer.concat(chunks));
+        chunks.length=0;
+        stream.resume();
+      },fail);
+    });
+    stream.on('error',fail);
+    // 'end' can arrive while the spill file is still being opened (spill on the last chunk)
+    stream.on('end',()=>{
+      const finish=()=>{
+        if(failed) return;
+        const digest=hash.digest('hex');
+        if(out) out.end((err)=>err?fail(err):cb(null,{path:outPath,size,hash:digest}));
+        else cb(null,{buffer:Buffer.concat(chunks,size),size,hash:digest});
+      };
+      if(opening) opening.then(finish); else finish();
+    });
+  }
+  function _removeFile(req,file,cb){
+    delete file.buffer;
+    if(!file.path) return cb(null);
+    fs.unlink(file.path,()=>cb(null));
+  }
+  return {_handleFile,_removeFile};
+}
+module.exports={spooledStorage};
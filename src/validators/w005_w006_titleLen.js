@@ -1,9 +1,12 @@
 'use strict';
+const {collapsedLength}=require('../process/normalize');
+const W005=Object.freeze({code:'W005',message:'Kop is korter dan 100 tekens. Controleer of dit voldoende is.'});
+const W006=Object.freeze({code:'W006',message:'Kop is langer dan 150 tekens. Overweeg inkorten.'});
 function titleLengthWarnings(title){
-  const len=String(title||'').replace(/\s+/g,' ').trim().length;
+  const len=collapsedLength(title);
   const warnings=[];
-  if(len>0&&len<100) warnings.push({code:'W005',message:'Kop is korter dan 100 tekens. Controleer of dit voldoende is.'});
-  if(len>150) warnings.push({code:'W006',message:'Kop is langer dan 150 tekens. Overweeg inkorten.'});
+  if(len>0&&len<100) warnings.push(W005);
+  if(len>150) warnings.push(W006);
   return warnings;
 }
 module.exports={titleLengthWarnings};
@@ -1,19 +1,29 @@
 'use strict';
-function hasRelativeTime(text){
-  const t=String(text||'').toLowerCase();
-  return /\b(vandaag|gisteren|morgen|vanmiddag|vanochtend|vanavond|nu)\b/.test(t);
+// Relative time words and absolute dates (day + month on one line, or a year) in one scan.
+// Relative words are letters only and dates start at a digit, so no match can hide another.
+const {MONTHS_ALT}=require('../process/dateWords');
+const DATE_SCAN_RE=new RegExp(String.raw`\b(?:vandaag|gisteren|morgen|vanmiddag|vanochtend|vanavond|nu)\b|(?<abs>\b\d{1,2}\b.*\b${MONTHS_ALT}\b|\b\d{4}\b)`,'g');
+const W008_RELATIVE=Object.freeze({code:'W008',message:'Extern verifiëren: relatieve tijdsaanduiding gevonden. Voeg een datum toe of controleer.'});
+const W008_FLAGGED=Object.freeze({code:'W008',message:'Extern verifiëren: controleer namen, cijfers, data of citaten.'});
+function scanDates(text){
+  let relative=false;
+  for(const m of String(text||'').matchAll(DATE_SCAN_RE)){
+    if(m.groups.abs) return {relative,absolute:true}; // an absolute date settles the check
+    relative=true;
+  }
+  return {relative,absolute:false};
 }
-function externalVerifyWarnings(llmData){
+// combinedLower: title, intro and body joined and lowercased by the caller
+function externalVerifyWarnings(llmData,combinedLower=[llmData?.title,llmData?.intro,llmData?.body].filter(Boolean).join(' ').toLowerCase()){
   const warnings=[];
-  const combined=[llmData?.title,llmData?.intro,llmData?.body].filter(Boolean).join(' ');
-  const hasAbsDate=/\b\d{1,2}\b.*\b(januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)\b/i.test(combined) || /\b\d{4}\b/.test(combined);
-  if(hasRelativeTime(combined)&&!hasAbsDate){
-    warnings.push({code:'W008',message:'Extern verifiëren: relatieve tijdsaanduiding gevonden. Voeg een datum toe of controleer.'});
+  const dates=scanDates(combinedLower);
+  if(dates.relative&&!dates.absolute){
+    warnings.push(W008_RELATIVE);
     return warnings;
   }
   const ext=llmData?.flags?.extern_verifieren||[];
   if(Array.isArray(ext)&&ext.length>0){
-    warnings.push({code:'W008',message:'Extern verifiëren: controleer namen, cijfers, data of citaten.'});
+    warnings.push(W008_FLAGGED);
   }
   return warnings;
 }
@@ -1,3 +1,4 @@
 'use strict';
-function contactWarnings(){return [{code:'W009',message:'Contactinformatie gevonden. Controleer het contactblok (niet voor publicatie).'}];}
+const W009=Object.freeze({code:'W009',message:'Contactinformatie gevonden. Controleer het contactblok (niet voor publicatie).'});
+function contactWarnings(){return [W009];}
 module.exports={contactWarnings};
@@ -1,18 +1,32 @@
 'use strict';
 const {M}=require('./messages');
-function missingWWarnings(llmData){
+const W_KEYS=['wie','wat','waar','wanneer','waarom','hoe'];
+const HARD_KEYS=['wie','wat','waar','wanneer','waarom'];
+const W011=Object.freeze({code:'W011',message:'Wie ontbreekt. Controleer of dit in de bron staat.'});
+const W012=Object.freeze({code:'W012',message:'Wat ontbreekt. Controleer of dit in de bron staat.'});
+const W013=Object.freeze({code:'W013',message:'Waar ontbreekt. Controleer of dit in de bron staat.'});
+const W014=Object.freeze({code:'W014',message:'Wanneer ontbreekt. Controleer of dit in de bron staat.'});
+const E006=Object.freeze({code:'E006',message:M.E006});
+function wFieldPresence(llmData){
   const w=llmData&&llmData.w_fields?llmData.w_fields:{};
+  const present={};
+  for(const k of W_KEYS) present[k]=Boolean(String(w[k]||'').trim());
+  return present;
+}
+function missingWWarnings(present){
   const warnings=[];
-  if(!String(w.wie||'').trim()) warnings.push({code:'W011',message:'Wie ontbreekt. Controleer of dit in de bron staat.'});
-  if(!String(w.wat||'').trim()) warnings.push({code:'W012',message:'Wat ontbreekt. Controleer of dit in de bron staat.'});
-  if(!String(w.waar||'').trim()) warnings.push({code:'W013',message:'Waar ontbreekt. Controleer of dit in de bron staat.'});
-  if(!String(w.wanneer||'').trim()) warnings.push({code:'W014',message:'Wanneer ontbreekt. Controleer of dit in de bron staat.'});
+  if(!present.wie) warnings.push(W011);
+  if(!present.wat) warnings.push(W012);
+  if(!present.waar) warnings.push(W013);
+  if(!present.wanneer) warnings.push(W014);
   return {warnings};
 }
-function minFiveWError(llmData){
-  const w=llmData&&llmData.w_fields?llmData.w_fields:{};
-  const hard=['wie','wat','waar','wanneer','waarom'].filter(k=>!String(w[k]||'').trim());
-  if(hard.length>=2) return {error:{code:'E006',message:M.E006}};
+function minFiveWError(present){
+  // Only "two or more missing" matters, so stop counting at the second gap
+  let missing=0;
+  for(const k of HARD_KEYS){
+    if(!present[k]&&++missing>=2) return {error:E006};
+  }
   return {error:null};
 }
-module.exports={missingWWarnings,minFiveWError};
+module.exports={wFieldPresence,missingWWarnings,minFiveWError};